@@ -31,7 +31,7 @@ from .tasks import (
 )
 
 from .decodo import DecodoClient
-from .preprocessing import TextPreprocessor
+from .preprocessing import TextPreprocessor, ChunkFilter
 from .evaluation import QualityEvaluator
 from .storage import DatasetExporter
 
@@ -54,6 +54,7 @@ __all__ = [
     # Services
     "DecodoClient",
     "TextPreprocessor",
+    "ChunkFilter",
     "QualityEvaluator",
     "DatasetExporter",
 ]
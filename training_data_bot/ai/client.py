@@ -1,2 +1,11 @@
+from training_data_bot.core.concurrency import AdaptiveLimiter
+
+
 class AIClient:
-    pass
+    def __init__(self, limiter=None):
+        self.limiter = limiter or AdaptiveLimiter()
+
+    async def call(self, request, *args, **kwargs):
+        """Await a model request coroutine function under the "model" limit."""
+        async with self.limiter.acquire("model"):
+            return await request(*args, **kwargs)
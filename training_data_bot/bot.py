@@ -1,27 +1,35 @@
 import asyncio
+import multiprocessing
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from .core.config import settings
 from .core.logging import get_logger, LogContext
 from .core.exceptions import TrainingDataBotError, ConfigurationError
+from .core.concurrency import AdaptiveLimiter
 
 from .sources import UnifiedLoader
 from .decodo import DecodoClient
 from .ai import AIClient
 from .tasks import TaskManager
-from .preprocessing import TextPreprocessor
+from .preprocessing import TextPreprocessor, ChunkFilter
 from .evaluation import QualityEvaluator
 from .storage import DatasetExporter, DatabaseManager
+from .core import sharding
 from .core.models import (
     Document,
     DocumentType,
+    TextChunk,
     ExportFormat,
     ProcessingJob,
     Dataset,
     TaskType,
     QualityReport,
+    ShardStatus,
 )
 
 
@@ -50,14 +58,18 @@ class TrainingDataBot:
     def _init_components(self):
         """Initialize all bot components"""
         try:
-            self.loader = UnifiedLoader()
+            self.limiter = AdaptiveLimiter(**self.config.get("concurrency", {}))
+            self.loader = UnifiedLoader(limiter=self.limiter)
             self.decodo_client = DecodoClient()
-            self.ai_client = AIClient()
+            self.ai_client = AIClient(limiter=self.limiter)
             self.task_manager = TaskManager()
             self.preprocessor = TextPreprocessor()
+            self.chunk_filter = ChunkFilter(**self.config.get("chunk_filter", {}))
             self.evaluator = QualityEvaluator()
             self.exporter = DatasetExporter()
-            self.db_manager = DatabaseManager()
+            self.db_manager = DatabaseManager(
+                self.config.get("db_path", "training_data_bot.db")
+            )
 
             self.documents: Dict[UUID, Document] = {}
             self.datasets: Dict[UUID, Dataset] = {}
@@ -75,15 +87,19 @@ class TrainingDataBot:
             sources = [sources]
 
         documents = []
+        single_sources = []
         for source in sources:
-            if source.is_dir():
-                dir_docs = await self.loader.load_directory(source)
+            is_url = str(source).startswith(("http://", "https://"))
+            if not is_url and Path(source).is_dir():
+                dir_docs = await self.loader.load_directory(Path(source))
                 documents.extend(dir_docs)
             else:
-                doc = await self.loader.load_single(source)
-                documents.append(doc)
+                single_sources.append(source if is_url else Path(source))
+        # Goes through the shared adaptive limiter, one slot per source.
+        documents.extend(await self.loader.load_multiple(single_sources))
         for doc in documents:
             self.documents[doc.id] = doc
+        return documents
 
     async def process_documents(
         self,
@@ -94,6 +110,210 @@ class TrainingDataBot:
     ) -> Dataset:
         pass
 
+    async def process_documents_sharded(
+        self,
+        sources: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        num_shards: int,
+        shard_indices: Optional[List[int]] = None,
+        max_workers: Optional[int] = None,
+        task_types: Optional[List[TaskType]] = None,
+        quality_filter: bool = True,
+        lease_seconds: float = 600.0,
+    ) -> Optional[Dataset]:
+        """
+        Run the pipeline over deterministic shards of the inputs in parallel.
+
+        Directories are expanded into their files and each file or URL is
+        assigned to a shard by hash; each shard is processed in its own worker
+        process and written to ``output_dir``. Shards are claimed
+        atomically in the database under a lease that is renewed while they
+        run, so concurrent runs never process the same shard and shards of a
+        crashed host become claimable once their lease expires. Calling this
+        again only re-runs shards that have not completed. Independent hosts
+        sharing ``output_dir`` and the database can each pass their own
+        ``shard_indices``.
+
+        Each worker runs ``load_documents`` and ``process_documents`` on its
+        shard, so this only produces data once ``process_documents`` returns
+        a Dataset; until then every shard is recorded as failed.
+        Args:
+            sources: Input files, directories or URLs.
+            output_dir: Directory for shard files and the merged manifest.
+            num_shards: Number of partitions of the inputs.
+            shard_indices: Shards to run on this host. Defaults to every
+                claimable shard.
+            max_workers: Worker processes. Defaults to one per claimed shard.
+            task_types: Task types passed to ``process_documents``.
+            quality_filter: Passed to ``process_documents``.
+            lease_seconds: Time after which a shard of an unresponsive run
+                may be claimed by another run.
+        Returns:
+            The merged dataset once every shard has completed, otherwise None.
+        """
+        output_dir = Path(output_dir)
+        sources = sharding.expand_sources(sources)
+        run_id = sharding.make_run_id(sources, num_shards)
+        partitions = sharding.partition_sources(sources, num_shards)
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        claimed = await self.db_manager.claim_shards(
+            run_id, num_shards, owner, lease_seconds, shard_indices
+        )
+
+        failed = []
+        if claimed:
+            heartbeat = asyncio.create_task(
+                self._renew_shard_leases(run_id, claimed, owner, lease_seconds)
+            )
+            # Spawn rather than fork: the loop's threads and the open
+            # database connection must not leak into the workers.
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers or len(claimed),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            try:
+                results = await asyncio.gather(
+                    *(
+                        self._run_and_record_shard(
+                            executor,
+                            run_id,
+                            index,
+                            num_shards,
+                            owner,
+                            partitions[index],
+                            output_dir,
+                            task_types,
+                            quality_filter,
+                        )
+                        for index in claimed
+                    )
+                )
+                failed = [index for index in results if index is not None]
+            finally:
+                heartbeat.cancel()
+                executor.shutdown(wait=True)
+
+        if failed:
+            raise TrainingDataBotError(
+                f"Shards {failed} of run {run_id} failed; call again to re-run them"
+            )
+        if await self.db_manager.get_incomplete_shards(run_id, num_shards):
+            return None
+        return await self.merge_shards(run_id, output_dir)
+
+    async def _run_and_record_shard(
+        self,
+        executor: ProcessPoolExecutor,
+        run_id: str,
+        index: int,
+        num_shards: int,
+        owner: str,
+        sources: List[str],
+        output_dir: Path,
+        task_types: Optional[List[TaskType]],
+        quality_filter: bool,
+    ) -> Optional[int]:
+        """
+        Run one shard and record its outcome as soon as it finishes.
+
+        Returns the shard index if it failed, otherwise None.
+        """
+        output_path = output_dir / sharding.shard_file_name(index, num_shards)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _run_shard,
+                self.config,
+                sources,
+                str(output_path),
+                task_types,
+                quality_filter,
+            )
+        except Exception as e:
+            self.logger.error(f"Shard {index}/{num_shards} failed: {e}")
+            await self.db_manager.finish_shard(
+                run_id, index, owner, ShardStatus.FAILED, error=str(e)
+            )
+            return index
+
+        recorded = await self.db_manager.finish_shard(
+            run_id, index, owner, ShardStatus.COMPLETED, output_path.name
+        )
+        if not recorded:
+            self.logger.warning(
+                f"Shard {index}/{num_shards} lease was lost to another run; "
+                "its result was not recorded."
+            )
+        return None
+
+    async def _renew_shard_leases(
+        self, run_id: str, shard_indices: List[int], owner: str, lease_seconds: float
+    ):
+        """Keep the leases of running shards alive until cancelled."""
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            await self.db_manager.renew_leases(
+                run_id, shard_indices, owner, lease_seconds
+            )
+
+    async def merge_shards(self, run_id: str, output_dir: Union[str, Path]) -> Dataset:
+        """
+        Merge the shards of a completed run and write its manifest.
+        Args:
+            run_id: Id of the sharded run.
+            output_dir: Directory the manifest is written to.
+        """
+        shards = await self.db_manager.get_shards(run_id)
+        if not shards:
+            raise TrainingDataBotError(f"No shards recorded for run {run_id}")
+        num_shards = shards[0]["num_shards"]
+        incomplete = await self.db_manager.get_incomplete_shards(run_id, num_shards)
+        if incomplete:
+            raise TrainingDataBotError(
+                f"Run {run_id} has incomplete shards: {incomplete}"
+            )
+        # Rebuild paths from output_dir: hosts may mount it at different paths.
+        output_dir = Path(output_dir)
+        shard_paths = [
+            output_dir / sharding.shard_file_name(index, num_shards)
+            for index in range(num_shards)
+        ]
+        dataset = await asyncio.to_thread(
+            sharding.merge_shards, shard_paths, name=f"sharded-{run_id}"
+        )
+        await asyncio.to_thread(
+            sharding.write_manifest,
+            output_dir,
+            run_id,
+            num_shards,
+            shard_paths,
+            dataset,
+        )
+        self.datasets[dataset.id] = dataset
+        self.logger.info(
+            f"Merged {num_shards} shards into {dataset.total_examples} examples."
+        )
+        return dataset
+
+    def prefilter_chunks(self, chunks: List[TextChunk]) -> List[TextChunk]:
+        """
+        Drop junk chunks before they are sent to the model.
+
+        Statistics are recorded against the source of each chunk's document.
+        Args:
+            chunks: Chunks produced by the preprocessor.
+        """
+        by_document: Dict[UUID, List[TextChunk]] = {}
+        for chunk in chunks:
+            by_document.setdefault(chunk.document_id, []).append(chunk)
+
+        kept = []
+        for document_id, doc_chunks in by_document.items():
+            document = self.documents.get(document_id)
+            source = str(document.source) if document else str(document_id)
+            kept.extend(self.chunk_filter.filter(doc_chunks, source=source))
+        return kept
+
     async def evaluate_dataset(
         self,
         dataset: Dataset,
@@ -128,6 +348,8 @@ class TrainingDataBot:
                 "by_status": self._count_by_type(...),
                 "active": len([j for j in self.jobs.values()]),
             },
+            "chunk_filter": self.chunk_filter.get_statistics(),
+            "concurrency": self.limiter.stats(),
         }
 
     async def cleanup(self):
@@ -163,3 +385,29 @@ class TrainingDataBot:
             dataset=dataset, output_path=output_path, format=export_format
         )
         return dataset
+
+
+def _run_shard(
+    config: Dict[str, Any],
+    sources: List[str],
+    output_path: str,
+    task_types: Optional[List[TaskType]],
+    quality_filter: bool,
+) -> str:
+    """Process one shard in a worker process and write it to ``output_path``."""
+
+    async def _run():
+        async with TrainingDataBot(config) as bot:
+            documents = await bot.load_documents(sources) if sources else []
+            dataset = await bot.process_documents(
+                documents=documents,
+                task_types=task_types,
+                quality_filter=quality_filter,
+            )
+        if dataset is None:
+            raise TrainingDataBotError(
+                f"process_documents returned no dataset for shard {output_path}"
+            )
+        return sharding.write_shard(dataset, output_path)
+
+    return str(asyncio.run(_run()))
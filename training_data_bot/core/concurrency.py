@@ -0,0 +1,170 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+from training_data_bot.core.logging import get_logger
+
+
+def is_congestion_error(error: BaseException) -> bool:
+    """
+    Return True for errors that signal an overloaded or rate-limiting peer.
+
+    Timeouts (including cancellation by ``asyncio.wait_for``), connection
+    errors and HTTP 429/5xx responses count; anything else, e.g. a missing
+    file or a 404, does not.
+    """
+    if isinstance(error, (asyncio.CancelledError, TimeoutError, ConnectionError)):
+        return True
+    try:
+        import httpx
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        if isinstance(error, (httpx.TimeoutException, httpx.TransportError)):
+            return True
+    except ImportError:
+        pass
+    return False
+
+
+class _KeyState:
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.successes = 0
+        self.errors = 0
+        self.congestion_events = 0
+        self.avg_latency: Optional[float] = None
+        self.last_decrease = 0.0
+        self.condition = asyncio.Condition()
+
+
+class AdaptiveLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) concurrency limiter.
+
+    Each key (e.g. a web host, ``"file"`` or ``"model"``) gets its own
+    in-flight limit. Successful calls made while the key was at its limit
+    grow the limit by roughly one slot per round trip; congestion errors (see ``is_congestion_error``) and calls
+    slower than ``latency_target`` shrink it by ``decrease_factor``. Other
+    errors are counted but leave the limit alone. A single limiter can be
+    shared by all pipeline components.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = None,
+        smoothing: float = 0.2,
+        is_congestion: Callable[[BaseException], bool] = is_congestion_error,
+    ):
+        """
+        Args:
+            initial_limit: Starting in-flight limit for new keys.
+            min_limit: Lowest limit a key can be reduced to.
+            max_limit: Highest limit a key can grow to.
+            decrease_factor: Multiplier applied to the limit on congestion.
+            latency_target: Seconds above which a call counts as congested.
+                ``None`` reacts to errors only.
+            smoothing: Weight of the newest sample in the latency average.
+            is_congestion: Predicate deciding whether an error raised inside
+                ``acquire`` should shrink the limit.
+        """
+        self.logger = get_logger("core.AdaptiveLimiter")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.smoothing = smoothing
+        self.is_congestion = is_congestion
+        self._states: Dict[str, _KeyState] = {}
+
+    def _state(self, key: str) -> _KeyState:
+        if key not in self._states:
+            self._states[key] = _KeyState(float(self.initial_limit))
+        return self._states[key]
+
+    @asynccontextmanager
+    async def acquire(self, key: str = "default"):
+        """Wait for a free slot for ``key`` and hold it for the block."""
+        state = self._state(key)
+        async with state.condition:
+            await state.condition.wait_for(lambda: state.in_flight < int(state.limit))
+            state.in_flight += 1
+            # Only calls that used the full limit are evidence the limit can
+            # grow; otherwise quiet periods would drift it to max_limit.
+            saturated = state.in_flight >= int(state.limit)
+
+        started = time.monotonic()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            latency = time.monotonic() - started
+            async with state.condition:
+                state.in_flight -= 1
+                self._update(key, state, latency, error, saturated)
+                state.condition.notify_all()
+
+    def _update(
+        self,
+        key: str,
+        state: _KeyState,
+        latency: float,
+        error: Optional[BaseException],
+        saturated: bool,
+    ):
+        if state.avg_latency is None:
+            state.avg_latency = latency
+        else:
+            state.avg_latency += self.smoothing * (latency - state.avg_latency)
+
+        if error is not None:
+            state.errors += 1
+            congested = self.is_congestion(error)
+        else:
+            state.successes += 1
+            congested = (
+                self.latency_target is not None and latency > self.latency_target
+            )
+
+        if congested:
+            state.congestion_events += 1
+            # Only back off once per round trip, otherwise a burst of
+            # failures from the same congestion event collapses the limit.
+            now = time.monotonic()
+            if now - state.last_decrease >= state.avg_latency:
+                state.limit = max(
+                    float(self.min_limit), state.limit * self.decrease_factor
+                )
+                state.last_decrease = now
+                self.logger.debug(f"Limit for {key} reduced to {int(state.limit)}")
+        elif error is None and saturated:
+            state.limit = min(float(self.max_limit), state.limit + 1 / state.limit)
+
+    def get_limit(self, key: str) -> int:
+        """Return the current in-flight limit for ``key``."""
+        return int(self._state(key).limit)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return current limits and counters for every key seen so far."""
+        return {
+            key: {
+                "limit": int(state.limit),
+                "in_flight": state.in_flight,
+                "successes": state.successes,
+                "errors": state.errors,
+                "congestion_events": state.congestion_events,
+                "avg_latency": state.avg_latency,
+            }
+            for key, state in self._states.items()
+        }
@@ -115,3 +115,15 @@ class ProcessingJob(BaseEntity):
 class ExportFormat(str, Enum):
     JSONL = "jsonl"
     JSON = "json"
+
+
+class SamplingMode(str, Enum):
+    RESERVOIR = "reservoir"
+    STRATIFIED = "stratified"
+
+
+class ShardStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -0,0 +1,128 @@
+import datetime
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+from uuid import uuid4
+
+from training_data_bot.core.models import Dataset
+
+
+def shard_for(key: str, num_shards: int) -> int:
+    """
+    Map a document key to a shard index.
+
+    Uses a content hash rather than ``hash()`` so the assignment is stable
+    across processes, interpreter runs and hosts.
+    """
+    if num_shards <= 0:
+        raise ValueError("num_shards must be positive")
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def expand_sources(sources: Sequence[Union[str, Path]]) -> List[str]:
+    """
+    Expand directories into the files they contain.
+
+    Each file then hashes to its own shard, and the assignment is still
+    known before any document is loaded. URLs are passed through unchanged.
+    """
+    expanded = []
+    for source in sources:
+        if str(source).startswith(("http://", "https://")):
+            expanded.append(str(source))
+        elif Path(source).is_dir():
+            expanded.extend(
+                sorted(str(path) for path in Path(source).rglob("*") if path.is_file())
+            )
+        else:
+            expanded.append(str(source))
+    return expanded
+
+
+def partition_sources(
+    sources: Sequence[Union[str, Path]], num_shards: int
+) -> List[List[str]]:
+    """Split sources into ``num_shards`` deterministic partitions."""
+    if num_shards <= 0:
+        raise ValueError("num_shards must be positive")
+    shards: List[List[str]] = [[] for _ in range(num_shards)]
+    for source in sorted(str(source) for source in sources):
+        shards[shard_for(source, num_shards)].append(source)
+    return shards
+
+
+def make_run_id(sources: Sequence[Union[str, Path]], num_shards: int) -> str:
+    """Derive a run id from the inputs so re-runs resume the same run."""
+    hasher = hashlib.sha256(f"{num_shards}".encode("utf-8"))
+    for source in sorted(str(source) for source in sources):
+        hasher.update(b"\0" + source.encode("utf-8"))
+    return hasher.hexdigest()[:16]
+
+
+def shard_file_name(shard_index: int, num_shards: int) -> str:
+    return f"shard-{shard_index:05d}-of-{num_shards:05d}.json"
+
+
+def write_shard(dataset: Dataset, output_path: Union[str, Path]) -> Path:
+    """Write a shard dataset atomically so partial files are never merged."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name so a reclaimed shard written twice never collides.
+    tmp_path = output_path.with_suffix(f"{output_path.suffix}.{uuid4().hex}.tmp")
+    tmp_path.write_text(dataset.model_dump_json(), encoding="utf-8")
+    tmp_path.replace(output_path)
+    return output_path
+
+
+def merge_shards(
+    shard_paths: Sequence[Union[str, Path]], name: str, description: str = ""
+) -> Dataset:
+    """Merge shard datasets, in shard order, into a single dataset."""
+    shards = [
+        Dataset.model_validate_json(Path(path).read_text(encoding="utf-8"))
+        for path in shard_paths
+    ]
+    examples = [example for shard in shards for example in shard.examples]
+    first = shards[0] if shards else None
+    return Dataset(
+        name=name,
+        description=description,
+        examples=examples,
+        total_examples=len(examples),
+        train_split=first.train_split if first else 0.8,
+        validation_split=first.validation_split if first else 0.1,
+        test_split=first.test_split if first else 0.1,
+    )
+
+
+def write_manifest(
+    output_dir: Union[str, Path],
+    run_id: str,
+    num_shards: int,
+    shard_paths: Sequence[Union[str, Path]],
+    dataset: Dataset,
+) -> Path:
+    """Write ``manifest.json`` describing the shards of a merged run."""
+    shards: List[Dict[str, Any]] = []
+    for index, path in enumerate(shard_paths):
+        path = Path(path)
+        shards.append(
+            {
+                "shard_index": index,
+                "path": path.name,
+                "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+            }
+        )
+    manifest = {
+        "run_id": run_id,
+        "dataset_id": str(dataset.id),
+        "num_shards": num_shards,
+        "total_examples": dataset.total_examples,
+        "created_at": datetime.datetime.utcnow().isoformat(),
+        "shards": shards,
+    }
+    manifest_path = Path(output_dir) / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest_path
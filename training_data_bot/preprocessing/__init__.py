@@ -0,0 +1,3 @@
+from .filters import ChunkFilter
+
+__all__ = ["ChunkFilter"]
@@ -0,0 +1,186 @@
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from training_data_bot.core.logging import get_logger
+from training_data_bot.core.models import TextChunk
+
+
+# Scripts written without spaces between words (CJK, kana, Thai, Lao,
+# Tibetan, Myanmar, Khmer). Each character counts as one word for them.
+UNSEGMENTED_CHARS = (
+    "\u0e00-\u0eff\u0f00-\u0fff\u1000-\u109f\u1780-\u17ff"
+    "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+)
+WORD_PATTERN = re.compile(
+    rf"[{UNSEGMENTED_CHARS}]|(?:(?![{UNSEGMENTED_CHARS}])\w)+", re.UNICODE
+)
+
+# Phrases that show up in navigation bars, footers and cookie banners
+# scraped by WebLoader. Matched case-insensitively against the chunk text.
+BOILERPLATE_PATTERN = re.compile(
+    r"\b(?:home|menu|login|log in|sign in|sign up|register|subscribe|newsletter"
+    r"|cookies?|cookie policy|privacy policy|terms of (?:use|service)"
+    r"|all rights reserved|copyright|contact us|about us|skip to (?:main )?content"
+    r"|share on|follow us|read more|click here|next|previous|back to top)\b"
+    r"|©",
+    re.IGNORECASE,
+)
+
+
+class ChunkFilter:
+    """
+    Cheap pre-generation filter for text chunks.
+
+    Chunks are rejected before any model call when they are too short,
+    dominated by boilerplate/navigation text, highly repetitive or written
+    in a script outside of ``allowed_scripts``. Rejection counts are kept
+    per source so junk-heavy sources can be spotted in the bot statistics.
+    """
+
+    REASON_TOO_SHORT = "too_short"
+    REASON_BOILERPLATE = "boilerplate"
+    REASON_REPETITIVE = "repetitive"
+    REASON_WRONG_SCRIPT = "wrong_script"
+
+    def __init__(
+        self,
+        min_words: int = 20,
+        min_chars: int = 100,
+        max_boilerplate_ratio: float = 0.3,
+        min_unique_word_ratio: float = 0.3,
+        max_duplicate_ngram_ratio: float = 0.5,
+        ngram_size: int = 3,
+        allowed_scripts: Optional[Iterable[str]] = ("LATIN",),
+        min_script_ratio: float = 0.8,
+    ):
+        """
+        Args:
+            min_words: Minimum number of words a chunk must contain. For
+                scripts without word separators (e.g. CJK, Thai) every
+                character counts as a word.
+            min_chars: Minimum number of non-whitespace characters.
+            max_boilerplate_ratio: Maximum share of words belonging to
+                boilerplate phrases.
+            min_unique_word_ratio: Minimum ratio of distinct words to words.
+            max_duplicate_ngram_ratio: Maximum share of word n-grams that
+                are repeats of an earlier n-gram in the same chunk.
+            ngram_size: Size of the word n-grams used for repetition checks.
+            allowed_scripts: Unicode script prefixes (e.g. "LATIN",
+                "CYRILLIC") accepted for alphabetic characters. ``None``
+                disables the script check.
+            min_script_ratio: Minimum share of alphabetic characters that
+                must belong to one of the allowed scripts.
+        """
+        self.logger = get_logger("preprocessing.ChunkFilter")
+        self.min_words = min_words
+        self.min_chars = min_chars
+        self.max_boilerplate_ratio = max_boilerplate_ratio
+        self.min_unique_word_ratio = min_unique_word_ratio
+        self.max_duplicate_ngram_ratio = max_duplicate_ngram_ratio
+        self.ngram_size = ngram_size
+        self.allowed_scripts = (
+            tuple(script.upper() for script in allowed_scripts)
+            if allowed_scripts
+            else None
+        )
+        self.min_script_ratio = min_script_ratio
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    def filter(
+        self, chunks: List[TextChunk], source: Optional[str] = None
+    ) -> List[TextChunk]:
+        """
+        Drop low-quality chunks and record per-source statistics.
+
+        Args:
+            chunks: Chunks to filter.
+            source: Source the chunks were extracted from. Defaults to the
+                chunk's document id.
+
+        Returns:
+            List[TextChunk]: The chunks that passed every check, in order.
+        """
+        kept = []
+        for chunk in chunks:
+            key = str(source if source is not None else chunk.document_id)
+            reason = self.evaluate(chunk.content)
+            stats = self._stats[key]
+            stats["total"] += 1
+            if reason is None:
+                stats["kept"] += 1
+                kept.append(chunk)
+            else:
+                stats["rejected"] += 1
+                stats[reason] += 1
+
+        rejected = len(chunks) - len(kept)
+        if rejected:
+            self.logger.info(
+                f"Pre-filter rejected {rejected}/{len(chunks)} chunks"
+                + (f" from {source}" if source is not None else "")
+            )
+        return kept
+
+    def evaluate(self, text: str) -> Optional[str]:
+        """
+        Return the rejection reason for ``text`` or ``None`` if it passes.
+
+        Checks run cheapest first so most junk is rejected early.
+        """
+        if len(text) - sum(1 for char in text if char.isspace()) < self.min_chars:
+            return self.REASON_TOO_SHORT
+
+        words = WORD_PATTERN.findall(text.lower())
+        if len(words) < self.min_words:
+            return self.REASON_TOO_SHORT
+
+        if self._boilerplate_ratio(text, len(words)) > self.max_boilerplate_ratio:
+            return self.REASON_BOILERPLATE
+
+        unique_ratio, duplicate_ratio = self._repetition_ratios(words)
+        if (
+            unique_ratio < self.min_unique_word_ratio
+            or duplicate_ratio > self.max_duplicate_ngram_ratio
+        ):
+            return self.REASON_REPETITIVE
+
+        if self.allowed_scripts and self._script_ratio(text) < self.min_script_ratio:
+            return self.REASON_WRONG_SCRIPT
+
+        return None
+
+    def get_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Return filter counters keyed by source."""
+        return {source: dict(stats) for source, stats in self._stats.items()}
+
+    def reset_statistics(self):
+        """Clear all collected filter counters."""
+        self._stats.clear()
+
+    def _boilerplate_ratio(self, text: str, word_count: int) -> float:
+        matched_words = sum(
+            len(match.group(0).split()) for match in BOILERPLATE_PATTERN.finditer(text)
+        )
+        return matched_words / word_count
+
+    def _repetition_ratios(self, words: List[str]) -> Tuple[float, float]:
+        unique_ratio = len(set(words)) / len(words)
+        n = self.ngram_size
+        if len(words) < n:
+            return unique_ratio, 0.0
+        ngrams = [tuple(words[i : i + n]) for i in range(len(words) - n + 1)]
+        duplicate_ratio = 1 - len(set(ngrams)) / len(ngrams)
+        return unique_ratio, duplicate_ratio
+
+    def _script_ratio(self, text: str) -> float:
+        letters = [char for char in text if char.isalpha()]
+        if not letters:
+            return 0.0
+        in_script = sum(
+            1
+            for char in letters
+            if unicodedata.name(char, "").startswith(self.allowed_scripts)
+        )
+        return in_script / len(letters)
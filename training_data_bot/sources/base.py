@@ -2,31 +2,49 @@ from abc import ABC, abstractmethod
 import asyncio
 import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from uuid import uuid4
 
+from training_data_bot.core.concurrency import AdaptiveLimiter
 from training_data_bot.core.logging import get_logger
 from training_data_bot.core.models import Document, DocumentType
 
 
 class BaseLoader(ABC):
-    def __init__(self):
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None):
         self.logger = get_logger(f"loader.{self.__class__.__name__}")
         self.supported_formats: List[DocumentType] = []
+        self.limiter = limiter or AdaptiveLimiter()
 
     @abstractmethod
     async def load_single(self, source, **kwargs) -> Document:
         pass
 
-    async def load_multiple(self, sources, max_workers=4):
-        semaphore = asyncio.Semaphore(max_workers)
+    async def load(self, source, **kwargs) -> Document:
+        """Load one source while holding a limiter slot for its key."""
+        async with self.limiter.acquire(self.get_limiter_key(source)):
+            return await self.load_single(source, **kwargs)
 
-        async def load_with_semaphore(source):
+    async def load_multiple(self, sources, max_workers=None):
+        """
+        Load sources concurrently under the adaptive limiter.
+
+        ``max_workers`` additionally caps the concurrency of this call.
+        """
+        semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+        async def load_with_limiter(source):
+            if semaphore is None:
+                return await self.load(source)
             async with semaphore:
-                return await self.load_single(source)
+                return await self.load(source)
 
-        tasks = [load_with_semaphore(source) for source in sources]
+        tasks = [load_with_limiter(source) for source in sources]
         results = await asyncio.gather(*tasks)
+        return results
+
+    def get_limiter_key(self, source):
+        return "file"
 
     def get_document_type(self, source):
         if source.startswith("http"):
@@ -8,8 +8,8 @@ from .base import BaseLoader
 
 
 class DocumentLoader(BaseLoader):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, limiter=None):
+        super().__init__(limiter)
         self.supported_formats = [
             DocumentType.TXT,
             DocumentType.MD,
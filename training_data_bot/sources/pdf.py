@@ -8,8 +8,8 @@ from training_data_bot.sources.base import BaseLoader
 
 
 class PDFLoader(BaseLoader):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, limiter=None):
+        super().__init__(limiter)
         self.supported_formats = [DocumentType.PDF]
 
     async def load_single(self, source):
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from training_data_bot.core.exceptions import DocumentLoadError
 from training_data_bot.core.models import DocumentType
 from .base import BaseLoader
 from .documents import DocumentLoader
@@ -8,10 +9,11 @@ from .pdf import PDFLoader
 
 
 class UnifiedLoader(BaseLoader):
-    def __init__(self):
-        self.document_loader = DocumentLoader()
-        self.pdf_loader = PDFLoader()
-        self.web_loader = WebLoader()
+    def __init__(self, limiter=None):
+        super().__init__(limiter)
+        self.document_loader = DocumentLoader(self.limiter)
+        self.pdf_loader = PDFLoader(self.limiter)
+        self.web_loader = WebLoader(self.limiter)
 
         self.supported_formats = list(DocumentType)
 
@@ -28,11 +30,31 @@ class UnifiedLoader(BaseLoader):
 
         if doctype == DocumentType.PDF:
             return self.pdf_loader
-        elif doctype in [DocumentType.TXT, DocumentType.DOCX, DocumentType.MD]:
+        elif doctype in self.document_loader.supported_formats:
             return self.document_loader
 
-    def load_single(self):
-        pass
-
-    def load_directory(self):
-        pass
+    def get_limiter_key(self, source):
+        loader = self._get_loader(str(source))
+        if loader is None:
+            return super().get_limiter_key(source)
+        return loader.get_limiter_key(str(source))
+
+    async def load_single(self, source, **kwargs):
+        # Called through ``load``/``load_multiple``, which hold the limiter
+        # slot of the delegate loader's key, so the delegate must not
+        # acquire again.
+        loader = self._get_loader(str(source))
+        if loader is None:
+            raise DocumentLoadError(str(source), "unsupported or missing source")
+        if loader is not self.web_loader:
+            source = Path(source)
+        return await loader.load_single(source, **kwargs)
+
+    async def load_directory(self, directory, max_workers=None):
+        supported = {doc_type.value for doc_type in self.supported_formats}
+        files = sorted(
+            path
+            for path in Path(directory).rglob("*")
+            if path.is_file() and path.suffix.lower().lstrip(".") in supported
+        )
+        return await self.load_multiple(files, max_workers=max_workers)
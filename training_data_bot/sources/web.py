@@ -1,3 +1,5 @@
+from urllib.parse import urlparse
+
 import httpx
 from training_data_bot.core.exceptions import DocumentLoadError
 from training_data_bot.core.models import DocumentType
@@ -5,10 +7,13 @@ from .base import BaseLoader
 
 
 class WebLoader(BaseLoader):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, limiter=None):
+        super().__init__(limiter)
         self.supported_formats = [DocumentType.URL]
 
+    def get_limiter_key(self, source):
+        return f"web:{urlparse(source).netloc}"
+
     async def load_single(self, source):
         if not source.startswith(("https://", "http://")):
             raise DocumentLoadError("Invalid URL: {source}")
@@ -57,7 +62,5 @@ class WebLoader(BaseLoader):
                 return title_tag.text.strip()
         except ImportError:
             pass
-        from urllib.parse import urlparse
-
         parsed = urlparse(url)
         return parsed.netloc + parsed.path or url
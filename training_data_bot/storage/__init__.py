@@ -4,5 +4,5 @@ from .manage import DatabaseManager
 
 __all__ = [
     "DatasetExporter",
-    "DatabaseManager"
+    "DatabaseManager",
 ]
@@ -1,2 +1,225 @@
-class DatabaseExporter:
-    pass
+import asyncio
+import bisect
+import hashlib
+import heapq
+import json
+from pathlib import Path
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from training_data_bot.core.logging import get_logger
+from training_data_bot.core.models import (
+    Dataset,
+    ExportFormat,
+    SamplingMode,
+    TrainingExample,
+)
+
+
+def _fill_level(counts: Iterable[int], sample_size: int) -> Optional[int]:
+    """
+    Largest per-stratum quota ``L`` with ``sum(min(count, L)) <= sample_size``.
+
+    Small strata contribute everything they have and their unused share is
+    spread over the larger ones. Returns ``None`` when every stratum fits.
+    """
+    sizes = sorted(counts)
+    remaining = sample_size
+    for i, count in enumerate(sizes):
+        share = remaining // (len(sizes) - i)
+        if count > share:
+            return share
+        remaining -= count
+    return None
+
+
+class _StratifiedReservoir:
+    """
+    Single-pass balanced sampler with bounded memory.
+
+    Every example gets a pseudo-random key derived from the seed and its id;
+    each stratum keeps the examples with the smallest keys, which is a
+    uniform sample of that stratum. Stratum quotas only ever shrink as the
+    stream grows, so nothing dropped early could have been needed later.
+    One example beyond the quota is kept per stratum so the slots left over
+    by rounding can be filled at the end. At most ``2 * sample_size`` plus
+    one example per stratum are held at any time.
+    """
+
+    def __init__(self, sample_size: int):
+        self.sample_size = sample_size
+        self.level: Optional[int] = None
+        self.held = 0
+        self.seen = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._heaps: Dict[Hashable, List[Tuple[float, int, TrainingExample]]] = {}
+
+    def add(self, stratum: Hashable, key: float, example: TrainingExample):
+        self.seen += 1
+        self._counts[stratum] = self._counts.get(stratum, 0) + 1
+        heap = self._heaps.setdefault(stratum, [])
+        # Max-heap on key via negation, so heap[0] is the worst kept example.
+        item = (-key, self.seen, example)
+        if self.level is None or len(heap) <= self.level:
+            heapq.heappush(heap, item)
+            self.held += 1
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+        if self.held > 2 * self.sample_size + len(self._counts):
+            self._rebalance()
+
+    def _rebalance(self):
+        level = _fill_level(self._counts.values(), self.sample_size)
+        if level is None:
+            return
+        if self.level is not None:
+            level = min(level, self.level)
+        self.level = level
+        for heap in self._heaps.values():
+            while len(heap) > level + 1:
+                heapq.heappop(heap)
+                self.held -= 1
+
+    def result(self) -> List[TrainingExample]:
+        """Return the sample ordered by key, which is reproducible per seed."""
+        self._rebalance()
+        if self.level is None:
+            selected = [item for heap in self._heaps.values() for item in heap]
+        else:
+            selected = []
+            spare = []
+            for stratum, heap in self._heaps.items():
+                ordered = sorted(heap, key=lambda item: (-item[0], item[1]))
+                selected.extend(ordered[: self.level])
+                if len(ordered) > self.level:
+                    extra = ordered[self.level]
+                    spare.append((-self._counts[stratum], -extra[0], extra[1], extra))
+            # Slots left over by the integer quota go to the largest strata,
+            # ties broken by key.
+            spare.sort(key=lambda entry: entry[:3])
+            remainder = self.sample_size - len(selected)
+            selected.extend(entry[3] for entry in spare[:remainder])
+        selected.sort(key=lambda item: (-item[0], item[1]))
+        return [example for _, _, example in selected]
+
+    @property
+    def num_strata(self) -> int:
+        return len(self._counts)
+
+
+class DatasetExporter:
+    def __init__(self):
+        self.logger = get_logger("storage.DatasetExporter")
+
+    @staticmethod
+    def iter_jsonl(path: Union[str, Path]) -> Iterator[TrainingExample]:
+        """Stream training examples from a JSONL file one line at a time."""
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield TrainingExample.model_validate_json(line)
+
+    async def export_sample(
+        self,
+        examples: Union[Dataset, Iterable[TrainingExample], str, Path],
+        output_path: Union[str, Path],
+        sample_size: int,
+        mode: SamplingMode = SamplingMode.STRATIFIED,
+        seed: int = 0,
+        format: ExportFormat = ExportFormat.JSONL,
+        quality_buckets: Optional[Sequence[float]] = None,
+    ) -> Path:
+        """
+        Export a sample of examples without materializing the full dataset.
+
+        The pass runs in a worker thread so the event loop is not blocked.
+        Args:
+            examples: A dataset, any iterable of examples or the path of a
+                JSONL export to stream from.
+            output_path: File to write the sample to.
+            sample_size: Maximum number of examples in the sample.
+            mode: ``RESERVOIR`` for a uniform sample, ``STRATIFIED`` for a
+                sample balanced across task type, source document and
+                quality score bucket.
+            seed: Seed for reproducible sampling. The same seed selects the
+                same examples regardless of input order.
+            format: Output format.
+            quality_buckets: Upper-exclusive edges used to bucket
+                ``quality_scores``. Defaults to one bucket per integer score.
+        Returns:
+            Path: The path of the written sample.
+        """
+        if sample_size <= 0:
+            raise ValueError("sample_size must be positive")
+        return await asyncio.to_thread(
+            self._export_sample,
+            examples,
+            Path(output_path),
+            sample_size,
+            SamplingMode(mode),
+            seed,
+            format,
+            quality_buckets,
+        )
+
+    def _export_sample(
+        self,
+        examples: Union[Dataset, Iterable[TrainingExample], str, Path],
+        output_path: Path,
+        sample_size: int,
+        mode: SamplingMode,
+        seed: int,
+        format: ExportFormat,
+        quality_buckets: Optional[Sequence[float]],
+    ) -> Path:
+        if isinstance(examples, (str, Path)):
+            examples = self.iter_jsonl(examples)
+        elif isinstance(examples, Dataset):
+            examples = examples.examples
+
+        edges = sorted(quality_buckets) if quality_buckets is not None else None
+        sampler = _StratifiedReservoir(sample_size)
+        for example in examples:
+            if mode == SamplingMode.STRATIFIED:
+                stratum = (
+                    example.task_type,
+                    example.source_document_id,
+                    bisect.bisect_right(edges, example.quality_scores)
+                    if edges is not None
+                    else example.quality_scores,
+                )
+            else:
+                stratum = None
+            sampler.add(stratum, self._sample_key(example, seed), example)
+
+        sample = sampler.result()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            if format == ExportFormat.JSONL:
+                for example in sample:
+                    f.write(example.model_dump_json() + "\n")
+            else:
+                json.dump([example.model_dump(mode="json") for example in sample], f)
+
+        self.logger.info(
+            f"Exported {len(sample)}/{sampler.seen} examples "
+            f"({mode.value}, {sampler.num_strata} strata) to {output_path}"
+        )
+        return output_path
+
+    @staticmethod
+    def _sample_key(example: TrainingExample, seed: int) -> float:
+        digest = hashlib.blake2b(
+            f"{seed}:{example.id}".encode("utf-8"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big") / 2**64
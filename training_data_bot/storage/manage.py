@@ -1,2 +1,261 @@
+import asyncio
+import datetime
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from training_data_bot.core.logging import get_logger
+from training_data_bot.core.models import ShardStatus
+
+
 class DatabaseManager:
-    pass
+    """
+    Persistent state for the bot backed by SQLite.
+
+    Shard state for sharded runs is stored here so that failed shards can be
+    re-run on their own and independent hosts sharing a filesystem see the
+    same progress. Shards are claimed under a lease; a shard whose lease
+    expired (e.g. its host crashed) can be claimed again.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = "training_data_bot.db"):
+        self.logger = get_logger("storage.DatabaseManager")
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode; transactions are opened explicitly below.
+            self._conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS shards (
+                    run_id TEXT NOT NULL,
+                    shard_index INTEGER NOT NULL,
+                    num_shards INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    owner TEXT,
+                    lease_expires REAL,
+                    output_path TEXT,
+                    error TEXT,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, shard_index)
+                )
+                """
+            )
+        return self._conn
+
+    async def _run(self, func, *args):
+        def _locked():
+            with self._lock:
+                return func(self._connect(), *args)
+
+        return await asyncio.to_thread(_locked)
+
+    async def claim_shards(
+        self,
+        run_id: str,
+        num_shards: int,
+        owner: str,
+        lease_seconds: float,
+        shard_indices: Optional[Sequence[int]] = None,
+    ) -> List[int]:
+        """
+        Atomically claim claimable shards of a run for ``owner``.
+
+        A shard is claimable when it is pending, failed, or running with an
+        expired lease. Missing shard rows are created as pending first.
+        Args:
+            run_id: Id of the sharded run.
+            num_shards: Total number of shards in the run.
+            owner: Unique id of the claiming process.
+            lease_seconds: How long the claim is valid without renewal.
+            shard_indices: Restrict the claim to these shards.
+        Returns:
+            List[int]: Indices of the shards now owned by ``owner``.
+        """
+
+        if num_shards <= 0:
+            raise ValueError("num_shards must be positive")
+        invalid = [
+            index for index in shard_indices or [] if not 0 <= index < num_shards
+        ]
+        if invalid:
+            raise ValueError(f"Shard indices {invalid} out of range for {num_shards}")
+
+        def _claim(conn: sqlite3.Connection) -> List[int]:
+            now = time.time()
+            updated_at = datetime.datetime.utcnow().isoformat()
+            candidates = range(num_shards) if shard_indices is None else shard_indices
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO shards
+                        (run_id, shard_index, num_shards, status, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            run_id,
+                            index,
+                            num_shards,
+                            ShardStatus.PENDING.value,
+                            updated_at,
+                        )
+                        for index in range(num_shards)
+                    ],
+                )
+                rows = conn.execute(
+                    """
+                    SELECT shard_index FROM shards
+                    WHERE run_id = ?
+                      AND (status IN (?, ?) OR (status = ? AND lease_expires < ?))
+                    """,
+                    (
+                        run_id,
+                        ShardStatus.PENDING.value,
+                        ShardStatus.FAILED.value,
+                        ShardStatus.RUNNING.value,
+                        now,
+                    ),
+                )
+                wanted = set(candidates)
+                claimed = sorted(
+                    row["shard_index"] for row in rows if row["shard_index"] in wanted
+                )
+                conn.executemany(
+                    """
+                    UPDATE shards
+                    SET status = ?, owner = ?, lease_expires = ?, error = NULL,
+                        updated_at = ?
+                    WHERE run_id = ? AND shard_index = ?
+                    """,
+                    [
+                        (
+                            ShardStatus.RUNNING.value,
+                            owner,
+                            now + lease_seconds,
+                            updated_at,
+                            run_id,
+                            index,
+                        )
+                        for index in claimed
+                    ],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return claimed
+
+        return await self._run(_claim)
+
+    async def renew_leases(
+        self,
+        run_id: str,
+        shard_indices: Sequence[int],
+        owner: str,
+        lease_seconds: float,
+    ):
+        """Extend the lease of running shards still owned by ``owner``."""
+
+        def _renew(conn: sqlite3.Connection):
+            conn.executemany(
+                """
+                UPDATE shards SET lease_expires = ?
+                WHERE run_id = ? AND shard_index = ? AND owner = ? AND status = ?
+                """,
+                [
+                    (
+                        time.time() + lease_seconds,
+                        run_id,
+                        index,
+                        owner,
+                        ShardStatus.RUNNING.value,
+                    )
+                    for index in shard_indices
+                ],
+            )
+
+        await self._run(_renew)
+
+    async def finish_shard(
+        self,
+        run_id: str,
+        shard_index: int,
+        owner: str,
+        status: ShardStatus,
+        output_path: Optional[Union[str, Path]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        Record the outcome of a shard claimed by ``owner``.
+
+        Returns False if the shard was reclaimed by another owner meanwhile,
+        in which case nothing is written.
+        """
+
+        def _finish(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                """
+                UPDATE shards
+                SET status = ?, output_path = ?, error = ?, lease_expires = NULL,
+                    updated_at = ?
+                WHERE run_id = ? AND shard_index = ? AND owner = ?
+                """,
+                (
+                    ShardStatus(status).value,
+                    str(output_path) if output_path else None,
+                    error,
+                    datetime.datetime.utcnow().isoformat(),
+                    run_id,
+                    shard_index,
+                    owner,
+                ),
+            )
+            return cursor.rowcount == 1
+
+        return await self._run(_finish)
+
+    async def get_shards(self, run_id: str) -> List[Dict[str, Any]]:
+        """Return the recorded state of every shard of a run."""
+
+        def _fetch(conn: sqlite3.Connection):
+            rows = conn.execute(
+                "SELECT * FROM shards WHERE run_id = ? ORDER BY shard_index",
+                (run_id,),
+            )
+            return [dict(row) for row in rows]
+
+        return await self._run(_fetch)
+
+    async def get_incomplete_shards(self, run_id: str, num_shards: int) -> List[int]:
+        """Return indices of shards that have not completed yet."""
+        completed = {
+            shard["shard_index"]
+            for shard in await self.get_shards(run_id)
+            if shard["status"] == ShardStatus.COMPLETED
+        }
+        return [index for index in range(num_shards) if index not in completed]
+
+    async def close(self):
+        """Close the underlying database connection."""
+
+        def _close():
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+        await asyncio.to_thread(_close)